@@ -12,45 +12,101 @@ from django.db import transaction
 @receiver(post_save, sender='availability.BlockedTime')
 def handle_blocked_time_change(sender, instance, **kwargs):
     """Handle blocked time changes."""
-    transaction.on_commit(lambda: _invalidate_cache_for_blocked_time(instance))
+    _queue_invalidation_for_blocked_time(instance)
 
 
 @receiver(post_delete, sender='availability.BlockedTime')
 def handle_blocked_time_deletion(sender, instance, **kwargs):
     """Handle blocked time deletion."""
-    transaction.on_commit(lambda: _invalidate_cache_for_blocked_time(instance))
+    _queue_invalidation_for_blocked_time(instance)
 
 
 @receiver(post_save, sender='availability.AvailabilityRule')
 def handle_availability_rule_change(sender, instance, **kwargs):
     """Handle availability rule changes."""
-    transaction.on_commit(lambda: _invalidate_cache_for_availability_rule(instance))
+    _queue_invalidation_for_availability_rule(instance)
 
 
 @receiver(post_delete, sender='availability.AvailabilityRule')
 def handle_availability_rule_deletion(sender, instance, **kwargs):
     """Handle availability rule deletion."""
-    transaction.on_commit(lambda: _invalidate_cache_for_availability_rule(instance))
+    _queue_invalidation_for_availability_rule(instance)
 
 
-def _invalidate_cache_for_blocked_time(blocked_time):
-    """Invalidate cache for blocked time changes."""
-    from apps.events.utils import invalidate_availability_cache
-    
+def _queue_invalidation_for_blocked_time(blocked_time):
+    """Queue cache invalidation for blocked time changes."""
     # Get date range from blocked time
     start_date = getattr(blocked_time, 'start_date', None)
     end_date = getattr(blocked_time, 'end_date', None)
     organizer = getattr(blocked_time, 'organizer', None)
     
     if organizer:
-        invalidate_availability_cache(organizer, start_date, end_date)
+        _queue_invalidation(organizer, start_date, end_date)
 
 
-def _invalidate_cache_for_availability_rule(availability_rule):
-    """Invalidate cache for availability rule changes."""
-    from apps.events.utils import invalidate_availability_cache
-    
+def _queue_invalidation_for_availability_rule(availability_rule):
+    """Queue cache invalidation for availability rule changes."""
     organizer = getattr(availability_rule, 'organizer', None)
     if organizer:
         # Availability rule changes affect all dates
-        invalidate_availability_cache(organizer)
\ No newline at end of file
+        _queue_invalidation(organizer)
+
+
+def _queue_invalidation(organizer, date_start=None, date_end=None):
+    """
+    Queue an invalidation to run once the current transaction commits.
+    
+    Invalidations for the same organizer are merged into one covering
+    date range, so bulk edits invalidate each organizer only once.
+    """
+    connection = transaction.get_connection()
+    pending = _get_pending_invalidations(connection)
+    new_batch = pending is None
+    if new_batch:
+        pending = {}
+    
+    if organizer.pk in pending:
+        _, pending_start, pending_end = pending[organizer.pk]
+        date_start = None if pending_start is None or date_start is None else min(pending_start, date_start)
+        date_end = None if pending_end is None or date_end is None else max(pending_end, date_end)
+    else:
+        # Stop readers caching results computed from the pre-commit data
+        from apps.events.utils import mark_availability_invalidation_pending
+        mark_availability_invalidation_pending(organizer.pk)
+    
+    pending[organizer.pk] = [organizer, date_start, date_end]
+    
+    if new_batch:
+        def flush():
+            _flush_invalidations(pending)
+        
+        connection.pending_availability_invalidations = (pending, flush)
+        transaction.on_commit(flush)
+
+
+def _get_pending_invalidations(connection):
+    """
+    Get the current transaction's pending invalidations, or None.
+    
+    Maps organizer ID to [organizer, date_start, date_end]; None dates mean
+    the range is unbounded on that side. A batch only belongs to the current
+    transaction while its flush is still queued: rollbacks discard the flush
+    and commits run it, so either way the next signal starts a new batch.
+    """
+    batch = getattr(connection, 'pending_availability_invalidations', None)
+    if batch is None:
+        return None
+    
+    pending, flush = batch
+    if not any(callback[1] is flush for callback in connection.run_on_commit):
+        connection.pending_availability_invalidations = None
+        return None
+    return pending
+
+
+def _flush_invalidations(pending):
+    """Run a transaction's queued invalidations, one per organizer."""
+    from apps.events.utils import invalidate_availability_cache
+    
+    for organizer, date_start, date_end in pending.values():
+        invalidate_availability_cache(organizer, date_start, date_end)
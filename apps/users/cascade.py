@@ -0,0 +1,112 @@
+"""
+Set-based cascade deletion for user accounts.
+
+Django's ``Model.delete()`` runs the ``Collector``, which loads every related
+row into memory and sends per-row signals. For accounts with thousands of
+bookings, audit logs and cache entries that is too slow and too memory hungry
+for a worker, so this module walks the relation graph instead and issues one
+``DELETE``/``UPDATE`` per related table, keyed by subqueries on the parent.
+"""
+from collections import Counter, deque
+from django.db import models, router, transaction
+from django.db.models.deletion import ProtectedError, RestrictedError, get_candidate_relations_to_delete
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _related_querysets(parent_model, parent_qs):
+    """
+    Yield (relation, queryset) pairs for rows that reference ``parent_qs``.
+    
+    Uses the same candidate relations as Django's ``Collector``, including
+    hidden ones (``related_name='+'``). Many-to-many through rows show up as
+    the through model's hidden foreign keys to the parent.
+    """
+    for relation in get_candidate_relations_to_delete(parent_model._meta):
+        field = relation.field
+        yield relation, relation.related_model._base_manager.filter(
+            **{f"{field.attname}__in": parent_qs.values(field.target_field.attname)}
+        )
+
+
+def _build_deletion_plan(root_model, root_qs):
+    """
+    Breadth-first walk of everything below ``root_qs``.
+    
+    Returns a list of ``(queryset, update_values)`` steps in parent-first
+    order; ``update_values`` is None for deletions. Executing the steps in
+    reverse removes leaves before the rows they point at.
+    """
+    plan = [(root_qs, None)]
+    queue = deque([(root_model, root_qs, (root_model,))])
+    
+    while queue:
+        parent_model, parent_qs, path = queue.popleft()
+        
+        for relation, related_qs in _related_querysets(parent_model, parent_qs):
+            on_delete = relation.on_delete
+            related_model = relation.related_model
+            
+            if on_delete is models.CASCADE:
+                plan.append((related_qs, None))
+                # Don't follow relation cycles back into a model on this path
+                if related_model not in path:
+                    queue.append((related_model, related_qs, path + (related_model,)))
+            elif on_delete is models.SET_NULL:
+                plan.append((related_qs, {relation.field.attname: None}))
+            elif on_delete is models.SET_DEFAULT:
+                plan.append((related_qs, {relation.field.attname: relation.field.get_default()}))
+            elif on_delete is models.DO_NOTHING:
+                continue
+            elif on_delete is models.PROTECT:
+                if related_qs.exists():
+                    raise ProtectedError(
+                        f"Cannot delete: {related_model._meta.label} rows are protected",
+                        set(related_qs[:10])
+                    )
+            elif on_delete is models.RESTRICT:
+                if related_qs.exists():
+                    raise RestrictedError(
+                        f"Cannot delete: {related_model._meta.label} rows are restricted",
+                        set(related_qs[:10])
+                    )
+            else:
+                raise ValueError(
+                    f"Unsupported on_delete handler for {relation.field} in cascade_delete"
+                )
+    
+    return plan
+
+
+def cascade_delete(user):
+    """
+    Delete a user and everything that depends on it with set-based SQL.
+    
+    The user is deactivated first so it cannot sign in while the deletion
+    runs. No model signals are sent for the removed rows.
+    
+    Args:
+        user: User instance to delete
+    
+    Returns:
+        Tuple of (deleted, updated) Counters of row counts keyed by model label
+    """
+    user_model = type(user)
+    using = router.db_for_write(user_model, instance=user)
+    root_qs = user_model._base_manager.using(using).filter(pk=user.pk)
+    
+    root_qs.update(is_active=False)
+    
+    deleted = Counter()
+    updated = Counter()
+    with transaction.atomic(using=using):
+        for queryset, update_values in reversed(_build_deletion_plan(user_model, root_qs)):
+            label = queryset.model._meta.label
+            if update_values is None:
+                deleted[label] += queryset.using(using)._raw_delete(using)
+            else:
+                updated[label] += queryset.using(using).update(**update_values)
+    
+    logger.info(f"Cascade deleted user {user.pk}: deleted {dict(deleted)}, updated {dict(updated)}")
+    return deleted, updated
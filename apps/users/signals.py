@@ -1,24 +1,40 @@
 """
 Signal handlers for the users module.
 """
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models import DEFERRED
+from django.db.models.signals import post_init, pre_save, post_save
 from django.dispatch import receiver
 from .models import Profile
 
 
+@receiver(post_init, sender=Profile)
+def snapshot_profile_timezone(sender, instance, **kwargs):
+    """Remember the timezone a profile was loaded with."""
+    # Deferred fields aren't in __dict__; reading them would hit the DB
+    instance._original_timezone_name = instance.__dict__.get('timezone_name', DEFERRED)
+
+
+@receiver(pre_save, sender=Profile)
+def detect_profile_timezone_change(sender, instance, update_fields=None, **kwargs):
+    """Flag profiles whose timezone is about to change."""
+    if instance._state.adding or (update_fields is not None and 'timezone_name' not in update_fields):
+        instance._timezone_changed = False
+        return
+    
+    instance._timezone_changed = (
+        instance._original_timezone_name != instance.__dict__.get('timezone_name', DEFERRED)
+    )
+
+
 @receiver(post_save, sender=Profile)
 def handle_profile_timezone_change(sender, instance, **kwargs):
     """Handle timezone changes in user profile."""
-    if kwargs.get('update_fields') and 'timezone_name' in kwargs['update_fields']:
-        # Timezone changed, invalidate availability cache
+    if getattr(instance, '_timezone_changed', False):
+        instance._timezone_changed = False
+        instance._original_timezone_name = instance.timezone_name
+        
+        # Timezone changed, invalidate availability cache once the save commits
         from apps.events.utils import invalidate_availability_cache
-        invalidate_availability_cache(instance.user)
-    elif not kwargs.get('update_fields'):
-        # Full save, check if timezone changed
-        try:
-            old_instance = Profile.objects.get(pk=instance.pk)
-            if old_instance.timezone_name != instance.timezone_name:
-                from apps.events.utils import invalidate_availability_cache
-                invalidate_availability_cache(instance.user)
-        except Profile.DoesNotExist:
-            pass
\ No newline at end of file
+        user = instance.user
+        transaction.on_commit(lambda: invalidate_availability_cache(user))
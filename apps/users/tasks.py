@@ -2,12 +2,18 @@
 Celery tasks for user account management.
 """
 from celery import shared_task
+from django.conf import settings
+from django.core.mail import send_mail
 from django.utils import timezone
 from django.db import transaction
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Users queued per cleanup_pending_deletions run, and per broker message
+PENDING_DELETION_BATCH_SIZE = 1000
+PENDING_DELETION_CHUNK_SIZE = 50
+
 
 @shared_task
 def process_account_deletion(user_id):
@@ -23,18 +29,23 @@ def process_account_deletion(user_id):
     try:
         from .models import User
         
+        from .cascade import cascade_delete
+        
         user = User.objects.get(id=user_id, account_status='pending_deletion')
+        email = user.email
+        
+        # Log the deletion
+        logger.info(f"Processing account deletion for user {email}")
+        
+        # Delete related rows table-by-table instead of through Django's
+        # Collector, which would load every related object into memory
+        cascade_delete(user)
+        
+        logger.info(f"Successfully deleted user account {user_id}")
+        
+        # Per-row signals are skipped, so notify once for the whole account
+        transaction.on_commit(lambda: send_account_deletion_confirmation.delay(email))
         
-        with transaction.atomic():
-            # Log the deletion
-            logger.info(f"Processing account deletion for user {user.email}")
-            
-            # Perform the actual deletion
-            # Django's CASCADE will handle related objects
-            user.delete()
-            
-            logger.info(f"Successfully deleted user account {user_id}")
-            
         return f"Successfully deleted user account {user_id}"
         
     except User.DoesNotExist:
@@ -48,12 +59,39 @@ def process_account_deletion(user_id):
 
 
 @shared_task
-def cleanup_pending_deletions():
+def send_account_deletion_confirmation(email):
+    """
+    Let a user know their account has been deleted.
+    
+    Args:
+        email: Email address of the deleted account
+    """
+    try:
+        send_mail(
+            "Your account has been deleted",
+            "Your account and all associated data have been permanently deleted.",
+            settings.DEFAULT_FROM_EMAIL,
+            [email],
+            fail_silently=False,
+        )
+        return f"Account deletion confirmation sent to {email}"
+        
+    except Exception as e:
+        logger.error(f"Error sending account deletion confirmation to {email}: {str(e)}")
+        return f"Error sending account deletion confirmation to {email}: {str(e)}"
+
+
+@shared_task
+def cleanup_pending_deletions(after_id=None):
     """
     Clean up users that have been marked for deletion but not processed.
     
     This task runs periodically to ensure no accounts are stuck in
-    pending_deletion status.
+    pending_deletion status. Each run queues at most
+    PENDING_DELETION_BATCH_SIZE users and reschedules itself for the rest.
+    
+    Args:
+        after_id: Only consider users with a greater ID (batch cursor)
     """
     try:
         from .models import User
@@ -66,14 +104,30 @@ def cleanup_pending_deletions():
             account_status='pending_deletion',
             updated_at__lt=cutoff_time
         )
+        if after_id is not None:
+            pending_users = pending_users.filter(id__gt=after_id)
+        
+        user_ids = list(
+            pending_users.order_by('id').values_list('id', flat=True)[:PENDING_DELETION_BATCH_SIZE]
+        )
+        
+        if not user_ids:
+            logger.info("No pending account deletions to process")
+            return "Queued 0 pending account deletions for processing"
+        
+        # Publish the whole batch as a few chunked messages rather than
+        # one broker round-trip per user
+        process_account_deletion.chunks(
+            [(user_id,) for user_id in user_ids],
+            PENDING_DELETION_CHUNK_SIZE
+        ).apply_async()
+        
+        count = len(user_ids)
         
-        count = 0
-        for user in pending_users:
-            try:
-                process_account_deletion.delay(user.id)
-                count += 1
-            except Exception as e:
-                logger.error(f"Error queuing deletion for user {user.id}: {str(e)}")
+        # A full batch means there may be more; pick them up in a fresh
+        # task after this batch instead of looping here
+        if count == PENDING_DELETION_BATCH_SIZE:
+            cleanup_pending_deletions.delay(after_id=user_ids[-1])
         
         logger.info(f"Queued {count} pending account deletions for processing")
         return f"Queued {count} pending account deletions for processing"
@@ -285,6 +285,8 @@ AVAILABILITY_REASONABLE_HOURS_START = config('AVAILABILITY_REASONABLE_HOURS_STAR
 AVAILABILITY_REASONABLE_HOURS_END = config('AVAILABILITY_REASONABLE_HOURS_END', default=22, cast=int)
 AVAILABILITY_SLOT_INTERVAL_MINUTES = config('AVAILABILITY_SLOT_INTERVAL_MINUTES', default=15, cast=int)
 AVAILABILITY_CACHE_DEBOUNCE_SECONDS = config('AVAILABILITY_CACHE_DEBOUNCE_SECONDS', default=300, cast=int)  # 5 minutes
+AVAILABILITY_VECTORIZE_MIN_DAYS = config('AVAILABILITY_VECTORIZE_MIN_DAYS', default=7, cast=int)  # Use NumPy slot generation for ranges this long
+AVAILABILITY_INVALIDATION_TOMBSTONE_SECONDS = config('AVAILABILITY_INVALIDATION_TOMBSTONE_SECONDS', default=5, cast=int)  # Suppress cache writes while an invalidation is in flight
 
 # Twilio Configuration (for SMS)
 TWILIO_ACCOUNT_SID = config('TWILIO_ACCOUNT_SID', default='')
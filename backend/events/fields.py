@@ -0,0 +1,56 @@
+"""
+Custom model fields for the events module.
+"""
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+import json
+
+try:
+    import orjson
+except ImportError:  # Falls back to the stdlib json module
+    orjson = None
+
+
+class OrjsonEncoder(DjangoJSONEncoder):
+    """
+    JSON encoder that serializes with orjson when it is installed.
+    
+    Django's JSONField calls ``json.dumps(value, cls=encoder)``, which hands
+    the whole value to ``encode()``, so overriding it swaps the serializer
+    without touching how the database adapts the value.
+    """
+    
+    def encode(self, o):
+        if orjson is None:
+            return super().encode(o)
+        return orjson.dumps(
+            o,
+            default=self.default,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+        ).decode()
+
+
+class OrjsonDecoder(json.JSONDecoder):
+    """JSON decoder that parses with orjson when it is installed."""
+    
+    def decode(self, s, *args, **kwargs):
+        if orjson is None:
+            return super().decode(s, *args, **kwargs)
+        return orjson.loads(s)
+
+
+class FastJSONField(models.JSONField):
+    """JSONField that uses orjson for database round-trips."""
+    
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('encoder', OrjsonEncoder)
+        kwargs.setdefault('decoder', OrjsonDecoder)
+        super().__init__(*args, **kwargs)
+    
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if kwargs.get('encoder') is OrjsonEncoder:
+            del kwargs['encoder']
+        if kwargs.get('decoder') is OrjsonDecoder:
+            del kwargs['decoder']
+        return name, path, args, kwargs
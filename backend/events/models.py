@@ -7,6 +7,7 @@ from datetime import timedelta
 import uuid
 import json
 import secrets
+from .fields import FastJSONField
 
 
 class EventType(models.Model):
@@ -835,7 +836,23 @@ class EventTypeAvailabilityCache(models.Model):
     attendee_count = models.IntegerField(default=1)
     
     # Cached data
-    available_slots = models.JSONField(help_text="Serialized available slots")
+    available_slots = FastJSONField(
+        default=list,
+        blank=True,
+        help_text="Serialized available slots (empty when stored packed)"
+    )
+    
+    # Packed slot storage: bit k of the bitmap marks an available slot
+    # starting slot_interval_minutes * k after slots_anchor
+    available_slots_packed = models.BinaryField(
+        null=True,
+        blank=True,
+        help_text="Bitmap of available slots on the slot grid"
+    )
+    slots_anchor = models.DateTimeField(null=True, blank=True)
+    slot_interval_minutes = models.IntegerField(null=True, blank=True)
+    slot_duration_minutes = models.IntegerField(null=True, blank=True)
+    slot_available_spots = models.IntegerField(null=True, blank=True)
     
     # Cache metadata
     computed_at = models.DateTimeField(auto_now_add=True)
@@ -861,6 +878,16 @@ class EventTypeAvailabilityCache(models.Model):
             models.Index(fields=['expires_at']),
             models.Index(fields=['is_dirty']),
             models.Index(fields=['organizer', 'date']),
+            # Clean-entry lookup in AvailabilityCalculator, without the dirty
+            # rows waiting for recomputation. No INCLUDE columns: the lookup
+            # also reads available_slots, so it can't be index-only, and
+            # copying the slot bitmap into the index would only make every
+            # upsert write more.
+            models.Index(
+                fields=['organizer', 'event_type', 'date', 'timezone_name', 'attendee_count'],
+                name='avc_lookup_idx',
+                condition=models.Q(is_dirty=False)
+            ),
         ]
     
     def __str__(self):
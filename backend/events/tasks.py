@@ -3,7 +3,7 @@ from django.core.mail import send_mail
 from django.conf import settings
 from django.utils import timezone
 from django.db import transaction
-from .models import Booking, WaitlistEntry, EventTypeAvailabilityCache
+from .models import Booking, BookingAuditLog, WaitlistEntry, EventTypeAvailabilityCache
 from .utils import create_booking_audit_log, invalidate_availability_cache
 import logging
 
@@ -43,6 +43,21 @@ def process_booking_confirmation(booking_id):
         return f"Error processing booking confirmation: {str(e)}"
 
 
+@shared_task
+def write_booking_audit_logs(payloads):
+    """
+    Write queued booking audit log entries.
+    
+    Args:
+        payloads: List of BookingAuditLog field dicts keyed by booking_id
+    """
+    logs = BookingAuditLog.objects.bulk_create(
+        [BookingAuditLog(**payload) for payload in payloads],
+        batch_size=200
+    )
+    return f"Wrote {len(logs)} booking audit logs"
+
+
 @shared_task
 def sync_booking_to_external_calendars(booking_id, retry_count=0):
     """
@@ -264,14 +279,15 @@ def recompute_dirty_availability_cache():
     dirty_entries = EventTypeAvailabilityCache.objects.filter(
         is_dirty=True,
         expires_at__gt=timezone.now()  # Only recompute non-expired entries
-    )
+    ).select_related('organizer__profile', 'event_type')
     
     recomputed_count = 0
     
-    for entry in dirty_entries:
+    for entry in dirty_entries.iterator(chunk_size=500):
         try:
-            from .utils import AvailabilityCalculator
+            from .utils import AvailabilityCalculator, availability_cache_writes_suppressed, pack_slots
             
+            computed_at = timezone.now()
             calculator = AvailabilityCalculator(
                 entry.organizer, 
                 entry.event_type, 
@@ -286,12 +302,18 @@ def recompute_dirty_availability_cache():
                 use_cache=False  # Don't use cache when recomputing
             )
             
+            # Leave the entry dirty if an invalidation ran while recomputing
+            if availability_cache_writes_suppressed(entry.organizer_id, computed_at):
+                continue
+            
             # Update cache entry
-            entry.available_slots = result['slots']
-            entry.computed_at = timezone.now()
+            packed_fields = pack_slots(result['slots'])
+            for field, value in packed_fields.items():
+                setattr(entry, field, value)
+            entry.computed_at = computed_at
             entry.is_dirty = False
             entry.computation_time_ms = result.get('performance_metrics', {}).get('computation_time_ms')
-            entry.save()
+            entry.save(update_fields=[*packed_fields, 'computed_at', 'is_dirty', 'computation_time_ms'])
             
             recomputed_count += 1
             
@@ -304,15 +326,100 @@ def recompute_dirty_availability_cache():
     return f"Recomputed {recomputed_count} dirty cache entries"
 
 
+@shared_task
+def persist_availability_cache(
+    organizer_id, event_type_id, date, timezone_name, attendee_count,
+    slots_json, computation_time_ms, computed_at, timeout
+):
+    """
+    Write a computed availability result to EventTypeAvailabilityCache.
+    
+    Queued by AvailabilityCalculator after the result has been stored in
+    the Django cache, so the upsert stays off the request path.
+    
+    Args:
+        organizer_id: Organizer UUID
+        event_type_id: EventType UUID
+        date: ISO date the result was computed for
+        timezone_name: Timezone the slots were computed in
+        attendee_count: Number of attendees the slots were computed for
+        slots_json: Slots serialized with serialize_slots()
+        computation_time_ms: Time taken to compute the result
+        computed_at: ISO timestamp of the computation
+        timeout: Cache lifetime in seconds
+    """
+    from datetime import date as date_cls, datetime, timedelta
+    from .utils import availability_cache_writes_suppressed, deserialize_slots, pack_slots
+    
+    computed_at = datetime.fromisoformat(computed_at)
+    
+    # Don't persist a result the organizer's cache was invalidated after
+    if availability_cache_writes_suppressed(organizer_id, computed_at):
+        return f"Skipped stale availability cache for event type {event_type_id} on {date}"
+    
+    slots = deserialize_slots(slots_json)
+    for slot in slots:
+        slot['start_time'] = datetime.fromisoformat(slot['start_time'])
+        slot['end_time'] = datetime.fromisoformat(slot['end_time'])
+    
+    entry, created = EventTypeAvailabilityCache.objects.update_or_create(
+        organizer_id=organizer_id,
+        event_type_id=event_type_id,
+        date=date_cls.fromisoformat(date),
+        timezone_name=timezone_name,
+        attendee_count=attendee_count,
+        defaults={
+            **pack_slots(slots),
+            'computed_at': computed_at,
+            'expires_at': computed_at + timedelta(seconds=timeout),
+            'is_dirty': False,
+            'computation_time_ms': computation_time_ms
+        }
+    )
+    
+    # auto_now_add overrides computed_at on insert; keep the computation time
+    if created and entry.computed_at != computed_at:
+        EventTypeAvailabilityCache.objects.filter(pk=entry.pk).update(computed_at=computed_at)
+    
+    return f"Persisted availability cache for event type {event_type_id} on {date}"
+
+
+@shared_task
+def mark_availability_cache_dirty(organizer_id, date_start=None, date_end=None):
+    """
+    Mark an organizer's availability cache rows dirty.
+    
+    Swept in the background after invalidate_availability_cache has dropped
+    the Redis copies, so the UPDATE stays off the request path.
+    
+    Args:
+        organizer_id: Organizer whose cache rows are stale
+        date_start: Optional ISO start date for range invalidation
+        date_end: Optional ISO end date for range invalidation
+    """
+    from datetime import date
+    
+    cache_entries = EventTypeAvailabilityCache.objects.filter(
+        organizer_id=organizer_id,
+        is_dirty=False
+    )
+    if date_start:
+        cache_entries = cache_entries.filter(date__gte=date.fromisoformat(date_start))
+    if date_end:
+        cache_entries = cache_entries.filter(date__lte=date.fromisoformat(date_end))
+    
+    updated = cache_entries.update(is_dirty=True)
+    
+    logger.info(f"Marked {updated} cache entries dirty for organizer {organizer_id}")
+    return f"Marked {updated} cache entries dirty for organizer {organizer_id}"
+
+
 @shared_task
 def cleanup_expired_cache_entries():
     """Clean up expired availability cache entries."""
-    expired_entries = EventTypeAvailabilityCache.objects.filter(
+    count, _ = EventTypeAvailabilityCache.objects.filter(
         expires_at__lt=timezone.now()
-    )
-    
-    count = expired_entries.count()
-    expired_entries.delete()
+    ).delete()
     
     logger.info(f"Cleaned up {count} expired cache entries")
     return f"Cleaned up {count} expired cache entries"
@@ -1,16 +1,29 @@
 """
 Utility functions for the events module.
 """
+import hashlib
+import json
 import logging
-from datetime import datetime, timedelta, date
+from bisect import bisect_left
+from functools import lru_cache
+from datetime import datetime, timedelta, date, time, timezone as dt_timezone
+from math import gcd
+from zoneinfo import ZoneInfo
 from typing import Dict, List, Any, Optional, Tuple
 from django.utils import timezone
-from django.core.cache import cache
+from django.utils.dateparse import parse_datetime
+from django.core.cache import cache, caches
+from django.core.cache.backends.redis import RedisCache
 from django.db import transaction
 from django.conf import settings
+try:
+    import numpy as np
+except ImportError:  # Vectorized slot generation is optional
+    np = None
+from .fields import OrjsonDecoder, OrjsonEncoder
 from .models import (
-    EventType, Booking, EventTypeAvailabilityCache, 
-    RecurringEventException, BookingAuditLog
+    EventType, Booking, EventTypeAvailabilityCache,
+    RecurringEventException
 )
 
 logger = logging.getLogger(__name__)
@@ -67,40 +80,413 @@ def create_booking_audit_log(
     new_values: Dict = None,
     metadata: Dict = None
 ):
-    """Create an audit log entry for booking-related actions."""
-    BookingAuditLog.objects.create(
-        booking=booking,
-        action=action,
-        description=description,
-        actor_type=actor_type,
-        actor_email=actor_email,
-        actor_name=actor_name,
-        ip_address=ip_address,
-        user_agent=user_agent,
-        old_values=old_values or {},
-        new_values=new_values or {},
-        metadata=metadata or {}
-    )
+    """
+    Create an audit log entry for booking-related actions.
+    
+    The row is written by a Celery task once the current transaction
+    commits, keeping the INSERT off the request path.
+    """
+    payload = {
+        'booking_id': str(booking.pk),
+        'action': action,
+        'description': description,
+        'actor_type': actor_type,
+        'actor_email': actor_email,
+        'actor_name': actor_name,
+        'ip_address': ip_address,
+        'user_agent': user_agent,
+        'old_values': old_values or {},
+        'new_values': new_values or {},
+        'metadata': metadata or {}
+    }
+    
+    from .tasks import write_booking_audit_logs
+    transaction.on_commit(lambda: write_booking_audit_logs.delay([payload]))
+
+
+def serialize_slots(slots: List[Dict]) -> str:
+    """Serialize availability slots (with datetimes) to a JSON string."""
+    return json.dumps(slots, cls=OrjsonEncoder)
+
+
+def deserialize_slots(slots_json: str) -> List[Dict]:
+    """Deserialize availability slots produced by serialize_slots()."""
+    return json.loads(slots_json, cls=OrjsonDecoder)
+
+
+def _pack_bits(indices: List[int], length: int) -> bytes:
+    """Pack bit indices into a big-endian bitmap (np.packbits layout)."""
+    if np is not None:
+        bits = np.zeros(length, dtype=bool)
+        bits[indices] = True
+        return np.packbits(bits).tobytes()
+    
+    bitmap = bytearray((length + 7) // 8)
+    for index in indices:
+        bitmap[index >> 3] |= 0x80 >> (index & 7)
+    return bytes(bitmap)
+
+
+def _unpack_bits(bitmap: bytes) -> List[int]:
+    """Get the indices of the set bits in a bitmap from _pack_bits()."""
+    if np is not None:
+        return np.flatnonzero(np.unpackbits(np.frombuffer(bitmap, dtype=np.uint8))).tolist()
+    
+    return [
+        byte_index * 8 + bit
+        for byte_index, byte in enumerate(bitmap) if byte
+        for bit in range(8) if byte & (0x80 >> bit)
+    ]
+
+
+def _json_slot_fields(slots: List[Dict]) -> Dict[str, Any]:
+    """Get the EventTypeAvailabilityCache field values storing slots as JSON."""
+    # The JSON field's encoder serializes the datetimes on save
+    return {
+        'available_slots': slots,
+        'available_slots_packed': None,
+        'slots_anchor': None,
+        'slot_interval_minutes': None,
+        'slot_duration_minutes': None,
+        'slot_available_spots': None,
+    }
+
+
+def pack_slots(slots: List[Dict]) -> Dict[str, Any]:
+    """
+    Get the EventTypeAvailabilityCache field values for storing slots.
+    
+    Slots share a duration and capacity and start on a regular grid, so
+    they are normally stored as a bitmap over that grid plus a few
+    scalars. Anything that doesn't fit is stored as the JSON list.
+    
+    Args:
+        slots: Slots with timezone-aware start_time/end_time datetimes
+        
+    Returns:
+        Dictionary of field values
+    """
+    if not slots:
+        return _json_slot_fields(slots)
+    
+    first = slots[0]
+    anchor = first['start_time'].astimezone(dt_timezone.utc)
+    duration = timedelta(minutes=first['duration_minutes'])
+    
+    offsets = []
+    for slot in slots:
+        slot_start = slot['start_time'].astimezone(dt_timezone.utc)
+        offset, remainder = divmod(slot_start - anchor, timedelta(minutes=1))
+        if (
+            remainder or offset < 0
+            or slot['duration_minutes'] != first['duration_minutes']
+            or slot['available_spots'] != first['available_spots']
+            or slot['end_time'].astimezone(dt_timezone.utc) - slot_start != duration
+        ):
+            return _json_slot_fields(slots)
+        offsets.append(offset)
+    
+    interval = 0
+    for offset in offsets:
+        interval = gcd(interval, offset)
+    interval = interval or first['duration_minutes']
+    
+    indices = [offset // interval for offset in offsets]
+    return {
+        'available_slots': [],
+        'available_slots_packed': _pack_bits(indices, max(indices) + 1),
+        'slots_anchor': anchor,
+        'slot_interval_minutes': interval,
+        'slot_duration_minutes': first['duration_minutes'],
+        'slot_available_spots': first['available_spots'],
+    }
+
+
+def unpack_slots(cache_entry, tz) -> List[Dict]:
+    """
+    Get the slots stored on an EventTypeAvailabilityCache entry.
+    
+    Args:
+        cache_entry: Entry written with pack_slots() field values
+        tz: Timezone to express slot times in
+        
+    Returns:
+        List of slot dictionaries
+    """
+    if cache_entry.available_slots_packed is None:
+        # JSON rows hold ISO strings; return datetimes like packed rows do
+        return [
+            {
+                **slot,
+                'start_time': parse_datetime(slot['start_time']).astimezone(tz),
+                'end_time': parse_datetime(slot['end_time']).astimezone(tz)
+            }
+            for slot in cache_entry.available_slots
+        ]
+    
+    anchor = cache_entry.slots_anchor
+    interval = timedelta(minutes=cache_entry.slot_interval_minutes)
+    duration = timedelta(minutes=cache_entry.slot_duration_minutes)
+    
+    slots = []
+    for index in _unpack_bits(bytes(cache_entry.available_slots_packed)):
+        slot_start = anchor + index * interval
+        slots.append({
+            'start_time': slot_start.astimezone(tz),
+            'end_time': (slot_start + duration).astimezone(tz),
+            'duration_minutes': cache_entry.slot_duration_minutes,
+            'available_spots': cache_entry.slot_available_spots
+        })
+    return slots
+
+
+def get_availability_cache_key(organizer_id, event_type_id, date, timezone_name, attendee_count) -> str:
+    """
+    Build the Django cache key for a cached availability result.
+    
+    The key components mirror the unique constraint on
+    EventTypeAvailabilityCache, hashed to keep the key short. The date is
+    kept readable so tag invalidation can filter keys by date range.
+    """
+    digest = hashlib.blake2b(
+        f"{organizer_id}:{event_type_id}:{date}:{timezone_name}:{attendee_count}".encode(),
+        digest_size=16
+    ).hexdigest()
+    return f"availability:{date.isoformat()}:{digest}"
+
+
+def _get_redis_client():
+    """Get the raw Redis client behind the default Django cache, or None."""
+    backend = caches['default']
+    if isinstance(backend, RedisCache):
+        # Django's built-in Redis backend
+        return backend._cache.get_client(write=True)
+    if type(backend).__module__.startswith('django_redis.'):
+        from django_redis import get_redis_connection
+        return get_redis_connection('default')
+    return None
+
+
+def _get_organizer_tag_key(organizer_id) -> str:
+    """Get the Redis set holding an organizer's availability cache keys."""
+    return cache.make_key(f"availability:org:{organizer_id}")
+
+
+def get_organizer_invalidated_at_key(organizer_id) -> str:
+    """Get the Django cache key recording an organizer's last invalidation."""
+    return f"availability:org:{organizer_id}:invalidated_at"
+
+
+def _get_organizer_tombstone_key(organizer_id) -> str:
+    """Get the Django cache key marking an organizer invalidation in flight."""
+    return f"availability:org:{organizer_id}:tombstone"
+
+
+def mark_availability_invalidation_pending(organizer_id):
+    """
+    Suppress availability cache writes for an organizer until it is invalidated.
+    
+    Called before the change that triggers the invalidation commits, so a
+    reader that computed slots from the old data can't repopulate the cache
+    between the commit and the invalidation. The tombstone expires on its
+    own, which also covers rolled back transactions.
+    """
+    tombstone_seconds = getattr(settings, 'AVAILABILITY_INVALIDATION_TOMBSTONE_SECONDS', 5)
+    try:
+        cache.set(_get_organizer_tombstone_key(organizer_id), True, tombstone_seconds)
+    except Exception as e:
+        # Runs inside the triggering save; the invalidation watermark and the
+        # post-write suppression check still cover the race without it
+        logger.error(f"Error marking availability invalidation pending for organizer {organizer_id}: {str(e)}")
+
+
+def availability_cache_writes_suppressed(organizer_id, computed_at) -> bool:
+    """
+    Check whether a result computed at computed_at may be cached.
+    
+    Returns:
+        True if an invalidation is in flight for the organizer, or one ran
+        after the result was computed
+    """
+    invalidated_at_key = get_organizer_invalidated_at_key(organizer_id)
+    tombstone_key = _get_organizer_tombstone_key(organizer_id)
+    flags = cache.get_many([invalidated_at_key, tombstone_key])
+    
+    if flags.get(tombstone_key):
+        return True
+    invalidated_at = flags.get(invalidated_at_key)
+    return bool(invalidated_at and invalidated_at >= computed_at)
+
+
+def tag_availability_cache_key(organizer_id, cache_key):
+    """
+    Record a cached availability key in its organizer's tag set.
+    
+    Does nothing when the Django cache isn't Redis; cache hits are also
+    checked against the organizer's invalidation time, which covers
+    entries without a tag.
+    
+    Args:
+        organizer_id: Organizer the cached entry belongs to
+        cache_key: Key as passed to the Django cache
+    """
+    client = _get_redis_client()
+    if client is None:
+        return
+    
+    tag_key = _get_organizer_tag_key(organizer_id)
+    cache_timeout = getattr(settings, 'AVAILABILITY_CACHE_TIMEOUT', 3600)
+    pipe = client.pipeline()
+    pipe.sadd(tag_key, cache.make_key(cache_key))
+    # No entry outlives the cache timeout, so refreshing the set to it keeps
+    # the set alive as long as any of its entries
+    pipe.expire(tag_key, cache_timeout)
+    pipe.execute()
 
 
 def invalidate_availability_cache(organizer, date_start=None, date_end=None):
     """
     Invalidate availability cache for an organizer.
     
+    Cached results are removed from Redis through the organizer's tag set,
+    so no table scan is needed. The database rows are marked dirty by a
+    background sweep; until then the organizer's invalidation time keeps
+    them from being served.
+    
     Args:
         organizer: User instance
         date_start: Optional start date for range invalidation
         date_end: Optional end date for range invalidation
     """
-    cache_entries = EventTypeAvailabilityCache.objects.filter(organizer=organizer)
+    cache_keys = []
+    try:
+        client = _get_redis_client()
+        tag_key = _get_organizer_tag_key(organizer.pk)
+        if client is not None:
+            cache_keys = client.smembers(tag_key)
+        
+        if date_start or date_end:
+            def in_range(made_key):
+                entry_date = date.fromisoformat(made_key.decode().rsplit(':', 2)[-2])
+                return (not date_start or entry_date >= date_start) and (not date_end or entry_date <= date_end)
+            
+            cache_keys = [made_key for made_key in cache_keys if in_range(made_key)]
+        
+        if cache_keys:
+            pipe = client.pipeline()
+            pipe.delete(*cache_keys)
+            pipe.srem(tag_key, *cache_keys)
+            pipe.execute()
+        
+        cache_timeout = getattr(settings, 'AVAILABILITY_CACHE_TIMEOUT', 3600)
+        cache.set(get_organizer_invalidated_at_key(organizer.pk), timezone.now(), cache_timeout)
+    except Exception as e:
+        # Runs from on_commit hooks, so the save has already committed;
+        # the dirty sweep below still keeps stale database rows from being
+        # served if it can be queued
+        logger.error(f"Error invalidating cached availability for organizer {organizer.pk}: {str(e)}")
+    
+    from .tasks import mark_availability_cache_dirty
+    try:
+        mark_availability_cache_dirty.delay(
+            organizer.pk,
+            date_start.isoformat() if date_start else None,
+            date_end.isoformat() if date_end else None
+        )
+    except Exception as e:
+        # The broker shares Redis with the cache, so this fails in the same outage
+        logger.error(
+            f"Error queueing dirty sweep for organizer {organizer.pk} "
+            f"({date_start or 'unbounded'} to {date_end or 'unbounded'}): {str(e)}"
+        )
     
-    if date_start:
-        cache_entries = cache_entries.filter(date__gte=date_start)
-    if date_end:
-        cache_entries = cache_entries.filter(date__lte=date_end)
+    logger.info(f"Invalidated {len(cache_keys)} cached availability keys for organizer {organizer.email}")
+
+
+def _candidate_bookings(bookings, slot_start, slot_end):
+    """Get the prefetched bookings that start early enough to overlap a slot."""
+    # Only bookings starting in [slot_start - max_length, slot_end) can overlap;
+    # subtract in UTC, since aware datetime arithmetic is wall-clock across DST
+    starts = bookings['starts']
+    window_start = slot_start.astimezone(dt_timezone.utc) - bookings['max_length']
+    return bookings['bookings'][
+        bisect_left(starts, window_start):bisect_left(starts, slot_end)
+    ]
+
+
+@lru_cache(maxsize=256)
+def _make_overlap_check(is_group, max_attendees):
+    """
+    Build the check for whether a slot can still take attendee_count people.
+    
+    Returns:
+        Function (bookings, slot_start, slot_end, attendee_count) -> bool,
+        where bookings comes from AvailabilityCalculator._get_confirmed_bookings
+    """
+    if is_group:
+        def is_free(bookings, slot_start, slot_end, attendee_count):
+            booked = sum(
+                row['attendee_count'] for row in _candidate_bookings(bookings, slot_start, slot_end)
+                if row['end_time'] > slot_start
+            )
+            return booked + attendee_count <= max_attendees
+    else:
+        def is_free(bookings, slot_start, slot_end, attendee_count):
+            return not any(
+                row['end_time'] > slot_start for row in _candidate_bookings(bookings, slot_start, slot_end)
+            )
+    
+    return is_free
+
+
+def _iter_slot_starts(day_start, last_start, slot_delta):
+    """Yield the wall-clock slot starts day_start + i * slot_delta up to last_start."""
+    i = 0
+    slot_start = day_start
+    while slot_start <= last_start:
+        yield slot_start
+        i += 1
+        slot_start = day_start + i * slot_delta
+
+
+@lru_cache(maxsize=4096)
+def _make_daily_slot_fn(duration, interval, is_group, max_attendees, start_hour, end_hour, tz_key):
+    """
+    Build a daily slot generator specialized for one slot configuration.
+    
+    Everything that is constant for an event type (durations, capacity,
+    working hours, timezone and the group/individual capacity check) is
+    resolved here once, so the per-slot loop only does the booking checks.
+    
+    Returns:
+        Function (date, attendee_count, bookings) -> list of slot dicts,
+        where bookings comes from AvailabilityCalculator._get_confirmed_bookings
+    """
+    tz = ZoneInfo(tz_key)
+    start_of_day = time(hour=start_hour)
+    end_of_day = time(hour=end_hour)
+    slot_delta = timedelta(minutes=interval)
+    duration_delta = timedelta(minutes=duration)
+    is_free = _make_overlap_check(is_group, max_attendees)
+    
+    def daily_slots(date, attendee_count, bookings):
+        day_start = datetime.combine(date, start_of_day, tzinfo=tz)
+        last_start = datetime.combine(date, end_of_day, tzinfo=tz) - duration_delta
+        
+        slots = []
+        for slot_start in _iter_slot_starts(day_start, last_start, slot_delta):
+            slot_end = slot_start + duration_delta
+            if is_free(bookings, slot_start, slot_end, attendee_count):
+                slots.append({
+                    'start_time': slot_start,
+                    'end_time': slot_end,
+                    'duration_minutes': duration,
+                    'available_spots': max_attendees
+                })
+        
+        return slots
     
-    cache_entries.update(is_dirty=True)
-    logger.info(f"Invalidated {cache_entries.count()} cache entries for organizer {organizer.email}")
+    return daily_slots
 
 
 class AvailabilityCalculator:
@@ -112,6 +498,7 @@ class AvailabilityCalculator:
         self.organizer = organizer
         self.event_type = event_type
         self.timezone_name = timezone_name
+        self._tz = ZoneInfo(timezone_name)
         
     def get_available_slots(
         self, 
@@ -168,7 +555,7 @@ class AvailabilityCalculator:
             # Cache the result if enabled
             if use_cache:
                 self._cache_availability_result(
-                    start_date, end_date, attendee_count, result, computation_time
+                    start_date, end_date, attendee_count, result, computation_time, start_time
                 )
             
             return result
@@ -186,112 +573,304 @@ class AvailabilityCalculator:
                 }
             }
     
+    def is_slot_available_at(self, start_time: datetime, attendee_count: int = 1) -> bool:
+        """
+        Check whether a single slot starting at start_time can be booked.
+        
+        Equivalent to looking for start_time in get_available_slots() for
+        that date, without generating the rest of the day's slots.
+        
+        Args:
+            start_time: Timezone-aware start of the requested slot
+            attendee_count: Number of attendees needed
+            
+        Returns:
+            True if the slot is available
+        """
+        start_time = start_time.astimezone(self._tz)
+        slot_date = start_time.date()
+        if not self.event_type.can_book_on_date(slot_date):
+            return False
+        
+        slot_settings = self._get_slot_settings()
+        day_start = datetime.combine(slot_date, time(hour=slot_settings['start_hour']), tzinfo=self._tz)
+        day_end = datetime.combine(slot_date, time(hour=slot_settings['end_hour']), tzinfo=self._tz)
+        end_time = start_time + timedelta(minutes=slot_settings['duration'])
+        
+        # The slot has to be inside working hours and on the interval grid
+        if start_time < day_start or end_time > day_end:
+            return False
+        if (start_time - day_start) % timedelta(minutes=slot_settings['interval']):
+            return False
+        
+        if self.event_type.recurrence_type != 'none' and self._get_cancelled_dates(slot_date, slot_date):
+            return False
+        
+        bookings = self._get_confirmed_bookings(start_time, end_time)
+        return self._is_slot_available(start_time, end_time, attendee_count, bookings, slot_settings)
+    
+    def _get_cache_key(self, date, attendee_count):
+        """Get the Django cache key for this calculator's result on a date."""
+        return get_availability_cache_key(
+            self.organizer.pk, self.event_type.pk, date, self.timezone_name, attendee_count
+        )
+    
+    def _build_cached_result(self, slots, computation_time_ms, computed_at):
+        """Build the response returned for a cache hit."""
+        return {
+            'slots': slots,
+            'total_slots': len(slots),
+            'cache_hit': True,
+            'performance_metrics': {
+                'computation_time_ms': computation_time_ms,
+                'cache_used': True,
+                'cached_at': computed_at.isoformat()
+            }
+        }
+    
     def _get_cached_availability(self, start_date, end_date, attendee_count):
         """Get cached availability if available and not expired."""
+        # Django cache first; the database row is the durable fallback
+        cache_key = self._get_cache_key(start_date, attendee_count)
+        invalidated_at_key = get_organizer_invalidated_at_key(self.organizer.pk)
+        tombstone_key = _get_organizer_tombstone_key(self.organizer.pk)
+        try:
+            cached = cache.get_many([cache_key, invalidated_at_key, tombstone_key])
+        except Exception as e:
+            # Without the invalidation watermark the database row can't be
+            # trusted either, so treat it as a miss and recompute
+            logger.error(f"Error reading cached availability: {str(e)}")
+            return None
+        
+        # Invalidation normally deletes hits through the tag set; the
+        # watermark also covers entries that never got a tag
+        hit = cached.get(cache_key)
+        invalidated_at = cached.get(invalidated_at_key)
+        if hit is not None and not (
+            invalidated_at and datetime.fromisoformat(hit['performance_metrics']['cached_at']) <= invalidated_at
+        ):
+            return hit
+        
+        # Rows computed before the last invalidation may not have been
+        # swept dirty yet
+        entry_filters = {}
+        if invalidated_at:
+            entry_filters['computed_at__gt'] = invalidated_at
+        
         try:
-            cache_entry = EventTypeAvailabilityCache.objects.get(
+            cache_entry = EventTypeAvailabilityCache.objects.only(
+                'available_slots', 'available_slots_packed', 'slots_anchor', 'slot_interval_minutes',
+                'slot_duration_minutes', 'slot_available_spots',
+                'computation_time_ms', 'computed_at', 'expires_at', 'is_dirty'
+            ).get(
                 organizer=self.organizer,
                 event_type=self.event_type,
                 date=start_date,  # Simplified - in production might need date range support
                 timezone_name=self.timezone_name,
                 attendee_count=attendee_count,
                 is_dirty=False,
-                expires_at__gt=timezone.now()
+                expires_at__gt=timezone.now(),
+                **entry_filters
             )
-            
-            return {
-                'slots': cache_entry.available_slots,
-                'total_slots': len(cache_entry.available_slots),
-                'cache_hit': True,
-                'performance_metrics': {
-                    'computation_time_ms': cache_entry.computation_time_ms,
-                    'cache_used': True,
-                    'cached_at': cache_entry.computed_at.isoformat()
-                }
-            }
         except EventTypeAvailabilityCache.DoesNotExist:
             return None
+        
+        result = self._build_cached_result(
+            unpack_slots(cache_entry, self._tz),
+            cache_entry.computation_time_ms,
+            cache_entry.computed_at
+        )
+        
+        # Repopulate the Django cache for the rest of the row's lifetime,
+        # unless an invalidation is in flight
+        ttl = int((cache_entry.expires_at - timezone.now()).total_seconds())
+        if ttl > 0 and not cached.get(tombstone_key):
+            try:
+                self._store_cached_result(cache_key, result, ttl, cache_entry.computed_at)
+            except Exception as e:
+                logger.error(f"Error repopulating cached availability: {str(e)}")
+        
+        return result
     
     def _calculate_availability(self, start_date, end_date, attendee_count):
         """Core availability calculation logic."""
         slots = []
         current_date = start_date
         
+        # Fetch every confirmed booking touching the range once, instead of
+        # querying per slot
+        range_start = datetime.combine(start_date, time(), tzinfo=self._tz)
+        range_end = datetime.combine(end_date + timedelta(days=1), time(), tzinfo=self._tz)
+        bookings = self._get_confirmed_bookings(range_start, range_end)
+        slot_settings = self._get_slot_settings()
+        
+        # Long ranges use NumPy to check every slot of a day in one pass
+        vectorize_min_days = getattr(settings, 'AVAILABILITY_VECTORIZE_MIN_DAYS', 7)
+        vectorize = np is not None and (end_date - start_date).days + 1 >= vectorize_min_days
+        if vectorize:
+            booking_arrays = self._get_booking_arrays(bookings)
+        
         while current_date <= end_date:
             if self.event_type.can_book_on_date(current_date):
-                daily_slots = self._get_daily_slots(current_date, attendee_count)
-                slots.extend(daily_slots)
+                if vectorize:
+                    slots.extend(self._get_daily_slots_vectorized(
+                        current_date, attendee_count, booking_arrays, slot_settings
+                    ))
+                else:
+                    slots.extend(self._get_daily_slots(current_date, attendee_count, bookings, slot_settings))
             current_date += timedelta(days=1)
         
         return slots
     
-    def _get_daily_slots(self, date, attendee_count):
-        """Get available slots for a specific date."""
-        # This is a simplified implementation
-        # In production, this would integrate with:
-        # - Organizer's availability rules from apps.availability
-        # - External calendar busy times
-        # - Existing bookings
-        # - Buffer times and constraints
-        
-        slots = []
+    def _get_slot_settings(self):
+        """
+        Read the event type and profile attributes used by the slot loop.
         
-        # Get organizer's working hours for this date
-        # (This would integrate with apps.availability module)
-        start_hour = getattr(self.organizer.profile, 'reasonable_hours_start', 9)
-        end_hour = getattr(self.organizer.profile, 'reasonable_hours_end', 17)
+        These are constant for a calculation, so they are resolved once
+        rather than going through the model descriptors for every slot.
+        """
+        profile = self.organizer.profile
+        return {
+            'duration': self.event_type.duration,
+            'interval': self.event_type.slot_interval_minutes or 30,
+            'max_attendees': self.event_type.max_attendees,
+            'is_group': self.event_type.is_group_event(),
+            'start_hour': getattr(profile, 'reasonable_hours_start', 9),
+            'end_hour': getattr(profile, 'reasonable_hours_end', 17),
+        }
+    
+    def _get_confirmed_bookings(self, range_start, range_end):
+        """
+        Get the organizer's confirmed bookings overlapping a time range.
         
-        # Generate slots based on event type duration and interval
-        slot_interval = self.event_type.slot_interval_minutes or 30
-        current_time = timezone.datetime.combine(date, timezone.datetime.min.time().replace(hour=start_hour))
-        end_time = timezone.datetime.combine(date, timezone.datetime.min.time().replace(hour=end_hour))
+        Returns:
+            Dictionary with the bookings sorted by start time, their start
+            times (for bisecting) and the longest booking length
+        """
+        bookings = list(
+            Booking.objects.filter(
+                organizer=self.organizer,
+                status='confirmed',
+                start_time__lt=range_end,
+                end_time__gt=range_start
+            ).order_by('start_time').values('start_time', 'end_time', 'attendee_count')
+        )
         
-        # Make timezone-aware
-        import pytz
-        tz = pytz.timezone(self.timezone_name)
-        current_time = tz.localize(current_time)
-        end_time = tz.localize(end_time)
+        return {
+            'bookings': bookings,
+            'starts': [booking['start_time'] for booking in bookings],
+            'max_length': max(
+                (booking['end_time'] - booking['start_time'] for booking in bookings),
+                default=timedelta(0)
+            )
+        }
+    
+    def _get_booking_arrays(self, bookings):
+        """
+        Convert prefetched bookings into epoch-second arrays for NumPy.
         
-        while current_time + timedelta(minutes=self.event_type.duration) <= end_time:
-            slot_end_time = current_time + timedelta(minutes=self.event_type.duration)
-            
-            # Check if slot is available (simplified check)
-            if self._is_slot_available(current_time, slot_end_time, attendee_count):
-                slots.append({
-                    'start_time': current_time,
-                    'end_time': slot_end_time,
-                    'duration_minutes': self.event_type.duration,
-                    'available_spots': self.event_type.max_attendees
-                })
-            
-            current_time += timedelta(minutes=slot_interval)
+        Starts and ends are each sorted with a leading-zero cumulative
+        attendee count, so the attendees of bookings that began before or
+        finished by a given instant can be read off with searchsorted.
+        Ends and attendee counts are also kept in start order for slots
+        whose overlaps have to be counted directly.
+        """
+        rows = bookings['bookings']
+        starts = np.array([int(booking['start_time'].timestamp()) for booking in rows], dtype=np.int64)
+        ends = np.array([int(booking['end_time'].timestamp()) for booking in rows], dtype=np.int64)
+        attendees = np.array([booking['attendee_count'] for booking in rows], dtype=np.int64)
+        end_order = np.argsort(ends, kind='stable')
         
-        return slots
+        return {
+            'starts': starts,
+            'start_ends': ends,
+            'attendees': attendees,
+            'start_attendees': np.concatenate(([0], np.cumsum(attendees))),
+            'ends': ends[end_order],
+            'end_attendees': np.concatenate(([0], np.cumsum(attendees[end_order]))),
+        }
     
-    def _is_slot_available(self, start_time, end_time, attendee_count):
-        """Check if a specific time slot is available."""
-        # Check existing bookings
-        conflicting_bookings = Booking.objects.filter(
-            organizer=self.organizer,
-            status='confirmed',
-            start_time__lt=end_time,
-            end_time__gt=start_time
-        )
+    def _get_daily_slots_vectorized(self, date, attendee_count, booking_arrays, slot_settings):
+        """Get available slots for a specific date using NumPy overlap checks."""
+        duration_delta = timedelta(minutes=slot_settings['duration'])
+        day_start = datetime.combine(date, time(hour=slot_settings['start_hour']), tzinfo=self._tz)
+        last_start = datetime.combine(date, time(hour=slot_settings['end_hour']), tzinfo=self._tz) - duration_delta
+        
+        # Same wall-clock grid as _get_daily_slots, so DST days agree
+        slot_starts = list(_iter_slot_starts(day_start, last_start, timedelta(minutes=slot_settings['interval'])))
+        slot_ends = [slot_start + duration_delta for slot_start in slot_starts]
+        start_epochs = np.array([int(slot_start.timestamp()) for slot_start in slot_starts], dtype=np.int64)
+        end_epochs = np.array([int(slot_end.timestamp()) for slot_end in slot_ends], dtype=np.int64)
         
-        # For group events, check total capacity
-        if self.event_type.is_group_event():
-            total_attendees = sum(booking.attendee_count for booking in conflicting_bookings)
-            return total_attendees + attendee_count <= self.event_type.max_attendees
+        # Bookings that started before the slot ends minus bookings that
+        # finished by the time it starts are exactly the overlapping ones
+        begun = np.searchsorted(booking_arrays['starts'], end_epochs, side='left')
+        finished = np.searchsorted(booking_arrays['ends'], start_epochs, side='right')
+        
+        if slot_settings['is_group']:
+            booked = booking_arrays['start_attendees'][begun] - booking_arrays['end_attendees'][finished]
         else:
-            return not conflicting_bookings.exists()
+            booked = begun - finished
+        
+        # A slot starting in a spring-forward gap can end before it starts in
+        # absolute time, which breaks the subtraction above; count its
+        # overlapping bookings directly instead
+        for index in np.flatnonzero(end_epochs < start_epochs).tolist():
+            overlapping = (
+                (booking_arrays['starts'] < end_epochs[index])
+                & (booking_arrays['start_ends'] > start_epochs[index])
+            )
+            if slot_settings['is_group']:
+                booked[index] = booking_arrays['attendees'][overlapping].sum()
+            else:
+                booked[index] = overlapping.sum()
+        
+        if slot_settings['is_group']:
+            available = booked + attendee_count <= slot_settings['max_attendees']
+        else:
+            available = booked == 0
+        
+        return [
+            {
+                'start_time': slot_start,
+                'end_time': slot_end,
+                'duration_minutes': slot_settings['duration'],
+                'available_spots': slot_settings['max_attendees']
+            }
+            for slot_start, slot_end, is_available in zip(slot_starts, slot_ends, available.tolist())
+            if is_available
+        ]
+    
+    def _get_daily_slots(self, date, attendee_count, bookings, slot_settings):
+        """Get available slots for a specific date."""
+        # This is a simplified implementation
+        # In production, this would integrate with:
+        # - Organizer's availability rules from apps.availability
+        # - External calendar busy times
+        # - Buffer times and constraints
+        daily_slots = _make_daily_slot_fn(
+            slot_settings['duration'],
+            slot_settings['interval'],
+            slot_settings['is_group'],
+            slot_settings['max_attendees'],
+            slot_settings['start_hour'],
+            slot_settings['end_hour'],
+            self.timezone_name
+        )
+        return daily_slots(date, attendee_count, bookings)
+    
+    def _is_slot_available(self, start_time, end_time, attendee_count, bookings, slot_settings):
+        """Check if a specific time slot is available against prefetched bookings."""
+        is_free = _make_overlap_check(slot_settings['is_group'], slot_settings['max_attendees'])
+        return is_free(bookings, start_time, end_time, attendee_count)
     
     def _apply_recurring_logic(self, slots, start_date, end_date):
         """Apply recurring event logic to slots."""
-        if not self.event_type.get_rrule_object():
+        rrule = self.event_type.get_rrule_object()
+        if not rrule:
             return slots
         
         try:
-            rrule = self.event_type.get_rrule_object()
             # Apply RRULE logic to generate recurring slots
             # This is a placeholder - full implementation would use dateutil.rrule
             return slots
@@ -299,51 +878,83 @@ class AvailabilityCalculator:
             logger.error(f"Error applying recurring logic: {str(e)}")
             return slots
     
+    def _get_cancelled_dates(self, start_date, end_date):
+        """Get the dates of cancelled recurring occurrences in a date range."""
+        return frozenset(
+            RecurringEventException.objects.filter(
+                event_type=self.event_type,
+                exception_type='cancelled',
+                exception_date__gte=start_date,
+                exception_date__lte=end_date
+            ).values_list('exception_date', flat=True)
+        )
+    
     def _apply_recurring_exceptions(self, slots, start_date, end_date):
         """Apply recurring event exceptions to slots."""
         if self.event_type.recurrence_type == 'none':
             return slots
         
         try:
-            exceptions = RecurringEventException.objects.filter(
-                event_type=self.event_type,
-                exception_date__gte=start_date,
-                exception_date__lte=end_date
-            )
+            cancelled_dates = self._get_cancelled_dates(start_date, end_date)
             
-            for exception in exceptions:
-                # Remove or modify slots based on exception type
-                if exception.exception_type == 'cancelled':
-                    slots = [slot for slot in slots 
-                            if slot['start_time'].date() != exception.exception_date]
-                elif exception.exception_type == 'rescheduled' and exception.new_start_time:
-                    # Apply rescheduling logic
-                    pass
+            # Rescheduled exceptions need no slot changes yet; only
+            # cancellations remove the occurrence's slots
+            if not cancelled_dates:
+                return slots
             
-            return slots
+            return [slot for slot in slots if slot['start_time'].date() not in cancelled_dates]
         except Exception as e:
             logger.error(f"Error applying recurring exceptions: {str(e)}")
             return slots
     
-    def _cache_availability_result(self, start_date, end_date, attendee_count, result, computation_time):
-        """Cache the availability calculation result."""
+    def _store_cached_result(self, cache_key, result, timeout, computed_at):
+        """
+        Write a result to the Django cache and the organizer's tag set.
+        
+        The key is tagged first, so a failed tag never leaves an entry that
+        invalidation can't find. The suppression check is repeated after
+        writing so a write that raced an invalidation is removed again.
+        """
+        tag_availability_cache_key(self.organizer.pk, cache_key)
+        cache.set(cache_key, result, timeout)
+        
+        if availability_cache_writes_suppressed(self.organizer.pk, computed_at):
+            cache.delete(cache_key)
+    
+    def _cache_availability_result(self, start_date, end_date, attendee_count, result, computation_time, computed_at):
+        """
+        Cache the availability calculation result.
+        
+        computed_at is when the calculation started, i.e. the point in time
+        whose bookings the result reflects.
+        """
         try:
             cache_timeout = getattr(settings, 'AVAILABILITY_CACHE_TIMEOUT', 3600)
-            expires_at = timezone.now() + timedelta(seconds=cache_timeout)
             
-            EventTypeAvailabilityCache.objects.update_or_create(
-                organizer=self.organizer,
-                event_type=self.event_type,
-                date=start_date,  # Simplified - might need range support
-                timezone_name=self.timezone_name,
-                attendee_count=attendee_count,
-                defaults={
-                    'available_slots': result['slots'],
-                    'computed_at': timezone.now(),
-                    'expires_at': expires_at,
-                    'is_dirty': False,
-                    'computation_time_ms': computation_time
-                }
+            # Don't cache results an invalidation has already superseded
+            if availability_cache_writes_suppressed(self.organizer.pk, computed_at):
+                return
+            
+            # The database copy is only a fallback, so write it out-of-band
+            from .tasks import persist_availability_cache
+            persist_kwargs = {
+                'organizer_id': str(self.organizer.pk),
+                'event_type_id': str(self.event_type.pk),
+                'date': start_date.isoformat(),  # Simplified - might need range support
+                'timezone_name': self.timezone_name,
+                'attendee_count': attendee_count,
+                'slots_json': serialize_slots(result['slots']),
+                'computation_time_ms': computation_time,
+                'computed_at': computed_at.isoformat(),
+                'timeout': cache_timeout
+            }
+            transaction.on_commit(lambda: persist_availability_cache.delay(**persist_kwargs))
+            
+            self._store_cached_result(
+                self._get_cache_key(start_date, attendee_count),
+                self._build_cached_result(result['slots'], computation_time, computed_at),
+                cache_timeout,
+                computed_at
             )
         except Exception as e:
             logger.error(f"Error caching availability result: {str(e)}")
@@ -388,7 +999,7 @@ def get_booking_by_access_token(access_token: str) -> Optional['Booking']:
         Booking instance if found and valid, None otherwise
     """
     try:
-        booking = Booking.objects.get(access_token=access_token)
+        booking = Booking.objects.select_related('organizer', 'event_type').get(access_token=access_token)
         if booking.is_access_token_valid():
             return booking
         return None
@@ -406,6 +1017,9 @@ def handle_booking_cancellation(
     """
     Handle booking cancellation with proper validation and logging.
     
+    Callers should load the booking with select_related('organizer') so the
+    audit actor doesn't trigger an extra query.
+    
     Args:
         booking: Booking instance to cancel
         cancelled_by: Who cancelled the booking
@@ -432,13 +1046,18 @@ def handle_booking_cancellation(
         booking.cancel(cancelled_by, reason)
         
         # Create audit log
+        if cancelled_by == 'invitee':
+            actor_email, actor_name = booking.invitee_email, booking.invitee_name
+        else:
+            actor_email, actor_name = booking.organizer.email, booking.organizer.get_full_name()
+        
         create_booking_audit_log(
             booking=booking,
             action='booking_cancelled',
             description=f"Booking cancelled by {cancelled_by}",
             actor_type=cancelled_by,
-            actor_email=booking.invitee_email if cancelled_by == 'invitee' else booking.organizer.email,
-            actor_name=booking.invitee_name if cancelled_by == 'invitee' else booking.organizer.get_full_name(),
+            actor_email=actor_email,
+            actor_name=actor_name,
             ip_address=ip_address,
             user_agent=user_agent,
             old_values=old_values,
@@ -487,18 +1106,7 @@ def handle_booking_rescheduling(
             booking.invitee_timezone
         )
         
-        availability = calculator.get_available_slots(
-            new_start_time.date(),
-            new_start_time.date(),
-            booking.attendee_count,
-            use_cache=False
-        )
-        
-        slot_available = any(
-            slot['start_time'] == new_start_time for slot in availability['slots']
-        )
-        
-        if not slot_available:
+        if not calculator.is_slot_available_at(new_start_time, booking.attendee_count):
             return False, ["The requested time slot is not available"]
         
         # Store old values for audit
@@ -511,7 +511,10 @@ def booking_management(request, access_token):
 def cancel_booking_legacy(request, booking_id):
     """Legacy endpoint for cancelling bookings - use booking management instead."""
     try:
-        booking = Booking.objects.get(id=booking_id, status='confirmed')
+        booking = Booking.objects.select_related('organizer', 'event_type').get(
+            id=booking_id,
+            status='confirmed'
+        )
         
         reason = request.data.get('reason', '')
         ip_address = get_client_ip_from_request(request)